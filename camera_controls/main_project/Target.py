@@ -1,3 +1,17 @@
+import glm
+
 class Target:
-    def __init__(self, position):
-        self.position = position
+    def __init__(self, positions, index):
+        # positions is a shared (N, 3) float32 array of target positions,
+        # index is the row that belongs to this target
+        self.positions = positions
+        self.index = index
+
+    # Returns a new vector each time, so callers may modify it freely
+    @property
+    def position(self):
+        return glm.vec3(self.positions[self.index])
+
+    @position.setter
+    def position(self, value):
+        self.positions[self.index] = value
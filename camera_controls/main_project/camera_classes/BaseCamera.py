@@ -1,6 +1,9 @@
 import glm
 
 class BaseCamera:
+    # Whether the camera zooms with the mouse wheel (process_mouse_scroll)
+    supports_mouse_scroll = False
+
     def __init__(self, position, world_up, yaw, pitch):
         # Initialization variables
         self.position = position
@@ -16,10 +19,26 @@ class BaseCamera:
         # Camera movement
         self.mouse_sensitivity = 0.1
         self.camera_speed = 5.0
+
+        # Set whenever yaw, pitch or distance change, so update_camera_vectors
+        # only recomputes the vectors when they are out of date
+        self._dirty = True
+        # Cached view matrix, rebuilt on the next get_view_matrix call when None
+        self._view_matrix = None
             
     # Recalculate the camera's position to reflect the new distance
     def get_view_matrix(self):
-        return glm.lookAt(self.position, self.position + self.front, self.up)
+        if self._view_matrix is None:
+            self._view_matrix = glm.lookAt(self.position, self.position + self.front, self.up)
+        return self._view_matrix
+
+    # Per-frame keyboard movement; cameras that move with the keyboard override this
+    def handle_keyboard(self, delta_time):
+        pass
+
+    # The field of vision used for the projection matrix
+    def get_fov(self):
+        return 45.0
 
     
 
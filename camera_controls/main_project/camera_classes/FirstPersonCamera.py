@@ -1,14 +1,39 @@
 import glm
-import math
+import pygame
 from .BaseCamera import BaseCamera
+from .camera_math import spherical_offset, camera_basis
 
 class FirstPersonCamera(BaseCamera):
+    # Movement keys mapped to (forward, strafe, vertical) amounts
+    _DIRS = {
+        pygame.K_w: (1, 0, 0),
+        pygame.K_s: (-1, 0, 0),
+        pygame.K_a: (0, -1, 0),
+        pygame.K_d: (0, 1, 0),
+        pygame.K_SPACE: (0, 0, 1),
+        pygame.K_LSHIFT: (0, 0, -1),
+    }
+
+    # Direction names mapped to the vector to move along and its sign
+    _MOVES = {
+        "FORWARD": ("front", 1),
+        "BACKWARD": ("front", -1),
+        "LEFT": ("right", -1),
+        "RIGHT": ("right", 1),
+        "UP": ("world_up", 1),
+        "DOWN": ("world_up", -1),
+    }
+
     def __init__(self, position, world_up, yaw, pitch):
         super().__init__(position, world_up, yaw, pitch)
         self.fov = 45.0
         self.update_camera_vectors()
 
     def process_mouse_movement(self, x_offset, y_offset, constrain_pitch=True):
+        # Nothing to update when the mouse has not moved
+        if not x_offset and not y_offset:
+            return
+
         # Scale the mouse offset by sensitivity
         x_offset *= self.mouse_sensitivity
         y_offset *= self.mouse_sensitivity
@@ -22,34 +47,54 @@ class FirstPersonCamera(BaseCamera):
             self.pitch = max(-89.0, min(89.0, self.pitch))
 
         # Recalculate the camera's direction vectors
+        self._dirty = True
         self.update_camera_vectors()
 
     def process_keyboard(self, direction, delta_time):
         velocity = self.camera_speed * delta_time
-        if direction == "FORWARD":
-            self.position += self.front * velocity
-        if direction == "BACKWARD":
-            self.position -= self.front * velocity
-        if direction == "LEFT":
-            self.position -= self.right * velocity
-        if direction == "RIGHT":
-            self.position += self.right * velocity
-        if direction == "UP":
-            self.position += self.world_up * velocity
-        if direction == "DOWN":
-            self.position -= self.world_up * velocity    
+        attr, sign = self._MOVES[direction]
+        self.position += getattr(self, attr) * (sign * velocity)
+        self._view_matrix = None
+
+    def process_keyboard_bulk(self, keys, delta_time):
+        # Sum every held movement key into one net move
+        forward = strafe = vertical = 0
+        for key, (f, s, v) in self._DIRS.items():
+            if keys[key]:
+                forward += f
+                strafe += s
+                vertical += v
+
+        # Apply the net move in a single vector update, normalized so that
+        # moving diagonally is no faster than moving along one axis
+        if forward or strafe or vertical:
+            direction = self.front * forward + self.right * strafe + self.world_up * vertical
+            length = glm.length(direction)
+            if length > 0.0:
+                self.position += direction * (self.camera_speed * delta_time / length)
+                self._view_matrix = None
+        
+    def handle_keyboard(self, delta_time):
+        # Only this camera reads the keys, so the others skip polling them
+        self.process_keyboard_bulk(pygame.key.get_pressed(), delta_time)
+
+    def get_fov(self):
+        # First-person camera uses FOV for "zoom"
+        return self.fov
         
     def update_camera_vectors(self):
+        # The vectors only depend on yaw and pitch, so skip the work when they have not changed
+        if not self._dirty:
+            return
+
         # The math to calculate the front vector from yaw and pitch
-        front = glm.vec3()
-        front.x = math.cos(glm.radians(self.yaw)) * math.cos(glm.radians(self.pitch))
-        front.y = math.sin(glm.radians(self.pitch))
-        front.z = math.sin(glm.radians(self.yaw)) * math.cos(glm.radians(self.pitch))
-        self.front = glm.normalize(front)
+        self.front = spherical_offset(self.yaw, self.pitch)
 
         # Calculate the right and up vectors
-        self.right = glm.normalize(glm.cross(self.front, glm.vec3(0.0, 1.0, 0.0)))
-        self.up = glm.normalize(glm.cross(self.right, self.front))
+        self.right, self.up = camera_basis(self.front)
+
+        self._dirty = False
+        self._view_matrix = None
 
     def handle_input():
         return
\ No newline at end of file
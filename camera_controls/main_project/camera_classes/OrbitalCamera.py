@@ -1,8 +1,10 @@
 import glm
-import math
 from .BaseCamera import BaseCamera
+from .camera_math import spherical_offset, camera_basis
 
 class OrbitalCamera(BaseCamera):
+    supports_mouse_scroll = True
+
     def __init__(self, position, world_up, yaw, pitch, target, distance_from_target):
         super().__init__(position, world_up, yaw, pitch)
         self.target = target
@@ -11,6 +13,10 @@ class OrbitalCamera(BaseCamera):
         self.update_camera_vectors()
 
     def process_mouse_movement(self, x_offset, y_offset, constrain_pitch=True):
+        # Nothing to update when the mouse has not moved
+        if not x_offset and not y_offset:
+            return
+
         # Scale mouse movement by sensitivity
         x_offset *= self.mouse_sensitivity
         y_offset *= self.mouse_sensitivity
@@ -24,6 +30,7 @@ class OrbitalCamera(BaseCamera):
             self.pitch = max(-89.0, min(89.0, self.pitch))
 
         # Recalculate the camera's position and vectors
+        self._dirty = True
         self.update_camera_vectors()
 
     # For zoom functionality via mouse scroll
@@ -31,28 +38,35 @@ class OrbitalCamera(BaseCamera):
         # Adjust the distance from the target
         self.distance_from_target -= y_offset
         self.distance_from_target = max(1.0, self.distance_from_target)
+        self._dirty = True
         self.update_camera_vectors()
 
     # Updates the position in the orbit
     def update_camera_vectors(self):
-        # Calculate position on a sphere using yaw, pitch, and distance
-        x = self.distance_from_target * math.cos(glm.radians(self.yaw)) * math.cos(glm.radians(self.pitch))
-        y = self.distance_from_target * math.sin(glm.radians(self.pitch))
-        z = self.distance_from_target * math.sin(glm.radians(self.yaw)) * math.cos(glm.radians(self.pitch))
+        # The orbit only depends on yaw, pitch and distance, so skip the work when they have not changed
+        if not self._dirty:
+            return
+
+        # Calculate the unit direction from the target using yaw and pitch
+        direction = spherical_offset(self.yaw, self.pitch)
         
         # Update the absolute position by offsetting from the target
-        self.position = self.target + glm.vec3(x, y, z)
+        self.position = self.target + direction * self.distance_from_target
         
-        # Calculate the front vector by pointing from the camera's position to the target
-        self.front = glm.normalize(self.target - self.position)
+        # The front vector points from the camera's position back to the target
+        self.front = -direction
         
         # Calculate the right and up vectors from the new front vector
-        self.right = glm.normalize(glm.cross(self.front, glm.vec3(0.0, 1.0, 0.0)))
-        self.up = glm.normalize(glm.cross(self.right, self.front))
+        self.right, self.up = camera_basis(self.front)
+
+        self._dirty = False
+        self._view_matrix = None
 
     def get_view_matrix(self):
         # Overridden to create a view matrix that looks from the camera's position to the target
-        return glm.lookAt(self.position, self.target, self.up)
+        if self._view_matrix is None:
+            self._view_matrix = glm.lookAt(self.position, self.target, self.up)
+        return self._view_matrix
     
     def handle_input():
         return
@@ -1,6 +1,8 @@
 import glm
 
 class OrthographicCamera():
+    supports_mouse_scroll = False
+
     def __init__(self, left, right, bottom, top, near, far):
         self.left = left
         self.right = right
@@ -11,18 +13,35 @@ class OrthographicCamera():
         self.position = glm.vec3(0.0, 0.0, 0.0)
         self.projection_matrix = glm.ortho(self.left, self.right, self.bottom, self.top, self.near, self.far)
         self.view_matrix = glm.mat4(1.0)
-        self.view_projection_matrix = self.projection_matrix * self.view_matrix
+        # The combined matrix is only rebuilt when it is read after a change
+        self._view_projection_matrix = None
+        self._vp_dirty = True
         self.position.z = 20.0
 
     def update_view_matrix(self):
-        self.view_matrix = glm.translate(glm.mat4(1.0), -self.position)
+        # The view is a pure translation, so only its last column is rewritten in place
+        self.view_matrix[3] = glm.vec4(-self.position, 1.0)
 
     def update_camera_vectors(self):
         self.update_view_matrix()
-        self.view_projection_matrix = self.projection_matrix * self.view_matrix
+        self._vp_dirty = True
+
+    @property
+    def view_projection_matrix(self):
+        if self._vp_dirty:
+            self._view_projection_matrix = self.projection_matrix * self.view_matrix
+            self._vp_dirty = False
+        return self._view_projection_matrix
 
     def get_view_matrix(self):
         return self.view_matrix
+
+    # Keyboard panning is event driven (see event_handler), so there is no per-frame movement
+    def handle_keyboard(self, delta_time):
+        pass
+
+    def get_fov(self):
+        return 45.0
         
     def move(self, dx, dy, dz):
         self.position.x += dx
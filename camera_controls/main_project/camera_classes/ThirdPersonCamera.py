@@ -1,8 +1,10 @@
 import glm
-import math
 from .BaseCamera import BaseCamera
+from .camera_math import spherical_offset
 
 class ThirdPersonCamera(BaseCamera):
+    supports_mouse_scroll = True
+
     def __init__(self, position, world_up, yaw, pitch, target, distance_from_target):
         super().__init__(position, world_up, yaw, pitch)
         self.target = target
@@ -15,23 +17,26 @@ class ThirdPersonCamera(BaseCamera):
         
         self.update_camera_vectors()
 
+    # The target moves on its own, so unlike the other cameras this always recomputes
     def update_camera_vectors(self):
         # Calculate the camera's position on a sphere around the target
-        theta = glm.radians(self.yaw)
-        phi = glm.radians(self.pitch)
-        
-        offset_x = self.distance_from_target * math.cos(theta) * math.cos(phi)
-        offset_y = self.distance_from_target * math.sin(phi)
-        offset_z = self.distance_from_target * math.sin(theta) * math.cos(phi)
+        offset = spherical_offset(self.yaw, self.pitch, self.distance_from_target)
 
-        # The camera's position is the target's position plus the offset
-        self.position = self.target.position - glm.vec3(offset_x, offset_y, offset_z)
+        # The camera's position is the target's position plus the offset.
+        # target.position returns a new vector, so the offset is applied to it in place.
+        position = self.target.position
+        position -= offset
+        self.position = position
 
     def get_view_matrix(self):
         # The view matrix for a third-person camera looks at its target
         return glm.lookAt(self.position, self.target.position, self.world_up)
 
     def process_mouse_movement(self, x_offset, y_offset, constrain_pitch=True):
+        # Nothing to update when the mouse has not moved
+        if not x_offset and not y_offset:
+            return
+
         x_offset *= self.mouse_sensitivity
         y_offset *= self.mouse_sensitivity
         
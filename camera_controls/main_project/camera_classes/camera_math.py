@@ -0,0 +1,28 @@
+import glm
+import math
+
+# Math shared by the cameras' update_camera_vectors. Each angle is converted
+# and its sine/cosine evaluated only once per call.
+
+# The cameras all treat +Y as the world up
+WORLD_UP = glm.vec3(0.0, 1.0, 0.0)
+
+# Degrees to radians as a plain multiply, cheaper than a math.radians call
+_DEG2RAD = math.pi / 180.0
+
+# Offset on a sphere of the given radius from yaw and pitch (in degrees).
+# With the default radius this is already a unit vector.
+def spherical_offset(yaw, pitch, distance=1.0):
+    ry = yaw * _DEG2RAD
+    rp = pitch * _DEG2RAD
+    cp = math.cos(rp)
+    return glm.vec3(distance * math.cos(ry) * cp,
+                    distance * math.sin(rp),
+                    distance * math.sin(ry) * cp)
+
+# Right and up vectors for a unit front vector
+def camera_basis(front):
+    right = glm.normalize(glm.cross(front, WORLD_UP))
+    # Right and front are perpendicular unit vectors, so up is already unit length
+    up = glm.cross(right, front)
+    return right, up
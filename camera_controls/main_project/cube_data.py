@@ -1,3 +1,5 @@
+import numpy as np
+
 cube_vertices = [
     # Positions           # Colors
 
@@ -49,4 +51,7 @@ cube_vertices = [
 -0.5,  0.5,  0.5,  0.0, 1.0, 1.0,  # bottom-left
 -0.5,  0.5, -0.5,  0.0, 1.0, 1.0   # top-left
 
-]
\ No newline at end of file
+]
+
+# The vertex data packed as float32 bytes, ready for glBufferData
+cube_vertices_bytes = np.asarray(cube_vertices, dtype=np.float32).tobytes()
\ No newline at end of file
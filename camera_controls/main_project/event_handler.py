@@ -1,6 +1,4 @@
 import pygame
-from camera_classes.OrbitalCamera import OrbitalCamera
-from camera_classes.ThirdPersonCamera import ThirdPersonCamera
 from camera_classes.OrthographicCamera import OrthographicCamera
 
 camera_speed = 1.0
@@ -8,7 +6,12 @@ camera_speed = 1.0
 # Event handling
 def handle_input(camera_manager, active_camera):
 
-    for event in pygame.event.get():
+    # Most frames have no events, so the active camera is handed straight back
+    events = pygame.event.get()
+    if not events:
+        return True, active_camera
+
+    for event in events:
         if event.type == pygame.QUIT:
             running = False
             get_grab = pygame.event.set_grab(False)
@@ -38,7 +41,7 @@ def handle_input(camera_manager, active_camera):
 
         if event.type == pygame.MOUSEWHEEL:
             y_offset = event.y
-            if isinstance(active_camera, (OrbitalCamera, ThirdPersonCamera)):
+            if active_camera.supports_mouse_scroll:
                 active_camera.process_mouse_scroll(y_offset)
 
     return True, camera_manager.get_active_camera()
\ No newline at end of file
@@ -2,8 +2,9 @@ import pygame
 from OpenGL.GL import *
 import numpy as np
 import glm
+import math
 import os
-from cube_data import cube_vertices
+from cube_data import cube_vertices_bytes
 from event_handler import handle_input
 from camera_classes.OrbitalCamera import OrbitalCamera
 from camera_classes.FirstPersonCamera import FirstPersonCamera
@@ -60,25 +61,35 @@ with open("fragment_shader.glsl") as f:
 
 shader_program = create_shader_program(vertex_shader_source, fragment_shader_source)
 
-# Cube data (vertices and colors)
-vertices = np.array(cube_vertices, dtype=np.float32)
+# Uniform locations never change after linking, so look them up once
+UNIFORMS = {name: glGetUniformLocation(shader_program, name) for name in ("view", "projection")}
+
+# Every cube's position lives in one array, one row per cube,
+# so all of them are moved with a single vector operation
+cube_positions = np.array([
+    [0.0, 0.0, 0.0],
+    [-5.0, 0.0, 0.0],
+    [-5.0, 3.0, 0.0],
+], dtype=np.float32)
 
 # A cube intended to move, demonstrating differences
 # In the third-person and orbital cameras
-cube_target = Target(position=glm.vec3(0.0, 0.0, 0.0))
+cube_target = Target(cube_positions, 0)
 
 # A cube intended to be still, for point of reference
-static_cube_target = Target(position=glm.vec3(-5.0, 0.0, 0.0))
+static_cube_target = Target(cube_positions, 1)
 
-reference_cube_target = Target(position=glm.vec3(-5.0,3.0,0.0))
+reference_cube_target = Target(cube_positions, 2)
 
 # VAO and VBO
 VAO = glGenVertexArrays(1)
 VBO = glGenBuffers(1)
 
+# Only one VAO is used, so it is bound here once and stays bound for the main loop
 glBindVertexArray(VAO)
 glBindBuffer(GL_ARRAY_BUFFER, VBO)
-glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+# Cube data (vertices and colors)
+glBufferData(GL_ARRAY_BUFFER, len(cube_vertices_bytes), cube_vertices_bytes, GL_STATIC_DRAW)
 
 # Position attribute
 glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 6 * 4, ctypes.c_void_p(0))
@@ -87,30 +98,52 @@ glEnableVertexAttribArray(0)
 glVertexAttribPointer(1, 3, GL_FLOAT, GL_FALSE, 6 * 4, ctypes.c_void_p(3 * 4))
 glEnableVertexAttribArray(1)
 
+# Instance VBO holding one position per cube, so every cube is drawn in one call
+instance_VBO = glGenBuffers(1)
+glBindBuffer(GL_ARRAY_BUFFER, instance_VBO)
+glBufferData(GL_ARRAY_BUFFER, cube_positions.nbytes, cube_positions, GL_DYNAMIC_DRAW)
+
+# Offset attribute, advanced once per cube instead of once per vertex
+glVertexAttribPointer(2, 3, GL_FLOAT, GL_FALSE, 3 * 4, ctypes.c_void_p(0))
+glEnableVertexAttribArray(2)
+glVertexAttribDivisor(2, 1)
+
 # Create the camera objects and manager
 first_person_cam = FirstPersonCamera()
 orbital_cam = OrbitalCamera()
 third_person_cam = ThirdPersonCamera(target=cube_target)
 orthographic_cam = OrthographicCamera()
 camera_manager = CameraManager(cameras = [first_person_cam, orbital_cam, third_person_cam, orthographic_cam])
-active_camera = 0
+active_camera = camera_manager.get_active_camera()
 
 # Main loop variables
 last_frame = 0.0
 mouse_x, mouse_y = 400, 300
 first_mouse = True
 
-# A vector to store the cube's movement direction
-move_direction = glm.vec3(1.0, 0.0, 0.0)
 # The maximum x-position the cube should reach before turning around
 max_x_position = 3.0
 # The speed of the cube
 cube_speed = 1.0
+# Each cube's velocity; only the first cube moves
+cube_velocities = np.zeros_like(cube_positions)
+cube_velocities[0] = (cube_speed, 0.0, 0.0)
+# The moving cubes come first, the rows after them never change after the initial upload
+moving_cube_count = 1
+moving_cube_positions = cube_positions[:moving_cube_count]
+
+# The projection only needs rebuilding when the field of view changes
+aspect_ratio = 800 / 600
+last_fov = None
+
+# Only one shader program is used, so it is bound once before the loop
+glUseProgram(shader_program)
 
 # Main loop
 running = True
 while running:
 
+    # handle_input hands back the active camera, so it is fetched once per frame
     running, active_camera = handle_input(camera_manager, active_camera)
 
     # Time for movement speed
@@ -118,34 +151,16 @@ while running:
     delta_time = current_frame - last_frame
     last_frame = current_frame
 
-    # Check if the cube has reached its boundary
-    if cube_target.position.x > max_x_position:
-        move_direction = -move_direction
-    elif cube_target.position.x < -max_x_position:
-        move_direction = -move_direction
+    # Reverse any cube that has reached its boundary
+    cube_velocities[np.abs(cube_positions[:, 0]) > max_x_position] *= -1
 
-    # Update the cube's position using the direction and speed
-    cube_target.position += move_direction * cube_speed * delta_time
+    # Update every cube's position using its velocity
+    cube_positions += cube_velocities * delta_time
 
-    active_camera = camera_manager.get_active_camera()
-    
     # Update the active camera's vectors (its position)
     
-    keys = pygame.key.get_pressed()
-
-    if isinstance(active_camera, FirstPersonCamera):
-        if keys[pygame.K_w]:
-            active_camera.process_keyboard("FORWARD", delta_time)
-        if keys[pygame.K_s]:
-            active_camera.process_keyboard("BACKWARD", delta_time)
-        if keys[pygame.K_a]:
-            active_camera.process_keyboard("LEFT", delta_time)
-        if keys[pygame.K_d]:
-            active_camera.process_keyboard("RIGHT", delta_time)
-        if keys[pygame.K_SPACE]:
-            active_camera.process_keyboard("UP", delta_time)
-        if keys[pygame.K_LSHIFT]:
-            active_camera.process_keyboard("DOWN", delta_time)
+    # Each camera handles its own keyboard movement, if it has any
+    active_camera.handle_keyboard(delta_time)
 
     active_camera.update_camera_vectors()
 
@@ -158,68 +173,27 @@ while running:
         if not active_camera == orthographic_cam:
             active_camera.process_mouse_movement(x_offset, -y_offset)
 
-    # Get the active camera
-    active_camera = camera_manager.get_active_camera()
-
-    # Use conditional logic to handle different camera attributes
-    fov = 45.0 # Default FOV
-    aspect_ratio = 800 / 600
-
-    if  not isinstance(active_camera, FirstPersonCamera):
-        # Fixes the field of vision
-        fov = 45.0
-    else:
-        # First-person camera uses FOV for "zoom"
-        # Assuming you have a 'fov' attribute in your FirstPersonCamera class
-        fov = active_camera.fov
-
- 
+    # Each camera reports the field of vision it renders with
+    fov = active_camera.get_fov()
 
     # Rendering
     glClearColor(0.2, 0.3, 0.3, 1.0)
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
-    glUseProgram(shader_program)
-
+    # The view matrix is read after the camera updates above
     view = active_camera.get_view_matrix()
-    projection = glm.perspective(glm.radians(fov), aspect_ratio, 0.1, 100.0)
-
-    view_loc = glGetUniformLocation(shader_program, "view")
-    projection_loc = glGetUniformLocation(shader_program, "projection"
-                                          )
-    glUniformMatrix4fv(view_loc, 1, GL_FALSE, glm.value_ptr(view))
-    glUniformMatrix4fv(projection_loc, 1, GL_FALSE, glm.value_ptr(projection))
-
-
-    model_loc = glGetUniformLocation(shader_program, "model")
-
-    model = glm.mat4(1.0)
-    model = glm.translate(model, cube_target.position)
-    glUniformMatrix4fv(model_loc, 1, GL_FALSE, glm.value_ptr(model))
-    glBindVertexArray(VAO)
-    glDrawArrays(GL_TRIANGLES, 0, 36) 
-
-    # Static Cube Matrix
-    static_model = glm.mat4(1.0)
-    static_model = glm.translate(static_model, static_cube_target.position)
-
-    static_model_loc = glGetUniformLocation(shader_program, "static_model")
-
-    glUniformMatrix4fv(model_loc, 1, GL_FALSE, glm.value_ptr(static_model))
-
-    glBindVertexArray(VAO)
-    glDrawArrays(GL_TRIANGLES, 0, 36)
-
-    # Reference Cube Matrix
-    reference_model = glm.mat4(1.0)
-    reference_model = glm.translate(reference_model, reference_cube_target.position)
-
-    reference_model_loc = glGetUniformLocation(shader_program, "reference_model")
-
-    glUniformMatrix4fv(model_loc, 1, GL_FALSE, glm.value_ptr(reference_model))
-
-    glBindVertexArray(VAO)
-    glDrawArrays(GL_TRIANGLES, 0, 36)
+    glUniformMatrix4fv(UNIFORMS["view"], 1, GL_FALSE, glm.value_ptr(view))
+
+    # Uniform values persist in the program, so the projection is only uploaded on change
+    if fov != last_fov:
+        projection = glm.perspective(math.radians(fov), aspect_ratio, 0.1, 100.0)
+        glUniformMatrix4fv(UNIFORMS["projection"], 1, GL_FALSE, glm.value_ptr(projection))
+        last_fov = fov
+
+    # Upload the moving cubes' positions and draw every cube in a single instanced call
+    glBindBuffer(GL_ARRAY_BUFFER, instance_VBO)
+    glBufferSubData(GL_ARRAY_BUFFER, 0, moving_cube_positions.nbytes, moving_cube_positions)
+    glDrawArraysInstanced(GL_TRIANGLES, 0, 36, len(cube_positions))
 
     pygame.display.flip()
 